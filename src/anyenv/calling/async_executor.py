@@ -199,13 +199,22 @@ class EventFilteredConnection[E]:
             if original_handler is handler:
                 return
 
-        # Create filtered handler wrapper
-        async def filtered_handler(event: Any) -> Any:
-            if isinstance(event, self._event_types):
-                if inspect.iscoroutinefunction(handler):
+        # Create filtered handler wrapper, resolving the handler kind once here
+        # instead of on every event
+        event_types = self._event_types
+        if inspect.iscoroutinefunction(handler):
+
+            async def filtered_handler(event: Any) -> Any:
+                if isinstance(event, event_types):
                     return await handler(event)  # type: ignore[arg-type]
-                return handler(event)  # type: ignore[arg-type]
-            return None
+                return None
+
+        else:
+
+            async def filtered_handler(event: Any) -> Any:
+                if isinstance(event, event_types):
+                    return handler(event)  # type: ignore[arg-type]
+                return None
 
         # Store mapping and add to observer system
         handlers_list.append((handler, filtered_handler))
@@ -387,13 +396,20 @@ class AsyncIteratorExecutor[**P, T]:
         if event_filter is None:
             self._observers.add_handler(handler)
         else:
-            # Create filtered handler wrapper
-            async def filtered_handler(event: T) -> Any:
-                if event_filter(event):
-                    if inspect.iscoroutinefunction(handler):
+            # Create filtered handler wrapper, resolving the handler kind once
+            if inspect.iscoroutinefunction(handler):
+
+                async def filtered_handler(event: T) -> Any:
+                    if event_filter(event):
                         return await handler(event)
-                    return handler(event)
-                return None
+                    return None
+
+            else:
+
+                async def filtered_handler(event: T) -> Any:
+                    if event_filter(event):
+                        return handler(event)
+                    return None
 
             # Store with a special key for lambda filters
             lambda_key = ("__lambda_filter__", id(event_filter))
@@ -4,15 +4,39 @@ from __future__ import annotations
 
 import concurrent.futures
 import contextvars
-import logging
+from functools import cache
+import threading
 from typing import TYPE_CHECKING, Any
 
+from anyenv.log import get_logger
+
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
     from types import TracebackType
 
 
+logger = get_logger(__name__)
+
+# Python 3.14+ can read a finished future's outcome without taking its condition lock.
+_HAS_SNAPSHOT = hasattr(concurrent.futures.Future, "_get_snapshot")
+
+
+def _get_result[R](future: concurrent.futures.Future[R]) -> R:
+    """Wait for the future and return its result, raising the task's exception.
+
+    Uses the lock-free ``Future._get_snapshot`` fast path for finished futures where
+    available, falling back to ``Future.result``.
+    """
+    if _HAS_SNAPSHOT:
+        done, cancelled, result, exc = future._get_snapshot()  # type: ignore[attr-defined]  # noqa: SLF001
+        if done and not cancelled:
+            if exc is not None:
+                raise exc
+            return result  # type: ignore[no-any-return]
+    return future.result()
+
+
 class ContextExecutor(concurrent.futures.ThreadPoolExecutor):
     """Thread pool executor that preserves context variables across threads.
 
@@ -35,6 +59,24 @@ class ContextExecutor(concurrent.futures.ThreadPoolExecutor):
             var.set(value)
 
 
+# Marks the worker threads of the shared executor, so groups opened from inside
+# one of its tasks can avoid waiting on the pool they are occupying.
+_shared_worker = threading.local()
+
+
+def _mark_shared_worker() -> None:
+    """Flag the current thread as a worker of the shared executor."""
+    _shared_worker.active = True
+
+
+@cache
+def _get_shared_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the process-wide executor used by ThreadGroups created with shared=True."""
+    return concurrent.futures.ThreadPoolExecutor(
+        thread_name_prefix="anyenv-tg", initializer=_mark_shared_worker
+    )
+
+
 class ThreadGroup[R = Any]:
     """Class that executes functions in parallel, with TaskGroup-like API."""
 
@@ -43,31 +85,41 @@ class ThreadGroup[R = Any]:
         max_workers: int | None = None,
         raise_exceptions: bool = True,
         preserve_context: bool = False,
+        shared: bool = False,
     ) -> None:
         """Thread task group that executes functions in parallel.
 
         Supports both sync and async context managers.
 
+        With ``shared=True`` and neither ``max_workers`` nor ``preserve_context``,
+        the group runs on a process-wide pool, so entering it does not start new
+        threads. Groups opened from a task of that pool get a dedicated pool
+        instead, as waiting on the pool they occupy could deadlock.
+
         Args:
             max_workers: Maximum number of worker threads
             raise_exceptions: If True, raises exceptions from tasks
             preserve_context: If True, preserves context variables across threads
+            shared: If True, runs on the shared process-wide executor when possible
         """
         self.max_workers = max_workers
         self.raise_exceptions = raise_exceptions
         self.preserve_context = preserve_context
 
+        self._owns_executor = True
         if preserve_context:
             self.executor: concurrent.futures.ThreadPoolExecutor = ContextExecutor(
                 max_workers=self.max_workers
             )
+        elif shared and max_workers is None and not getattr(_shared_worker, "active", False):
+            self.executor = _get_shared_executor()
+            self._owns_executor = False
         else:
             self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
 
         self.futures: list[concurrent.futures.Future[R]] = []
         self._results: list[R] = []
         self._exceptions: list[Exception] = []
-        self._logger = logging.getLogger(self.__class__.__name__)
 
     def spawn(
         self, func: Callable[..., R], *args: Any, **kwargs: Any
@@ -86,6 +138,23 @@ class ThreadGroup[R = Any]:
         self.futures.append(future)
         return future
 
+    def spawn_many(
+        self, func: Callable[..., R], args_iterable: Iterable[Iterable[Any]]
+    ) -> list[concurrent.futures.Future[R]]:
+        """Submit one task per argument tuple immediately to the executor.
+
+        Args:
+            func: The function to execute
+            args_iterable: Positional arguments for each call of the function
+
+        Returns:
+            Future objects for the submitted tasks, in submission order
+        """
+        submit = self.executor.submit
+        futures = [submit(func, *args) for args in args_iterable]
+        self.futures.extend(futures)
+        return futures
+
     def __enter__(self) -> ThreadGroup[R]:
         """Enter the context manager."""
         return self
@@ -96,15 +165,18 @@ class ThreadGroup[R = Any]:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Exit the context manager, collecting results from all futures."""
-        for future in concurrent.futures.as_completed(self.futures):
+        """Exit the context manager, collecting results in submission order."""
+        for future in self.futures:
             try:
-                result = future.result()
+                result = _get_result(future)
                 self._results.append(result)
             except Exception as e:
                 self._exceptions.append(e)
-                self._logger.exception("Task error")
+                logger.exception("Task error")
                 if self.raise_exceptions:
+                    # Drop queued work; tasks already running cannot be cancelled.
+                    for pending in self.futures:
+                        pending.cancel()
                     raise
 
         self.futures = []
@@ -123,8 +195,12 @@ class ThreadGroup[R = Any]:
         self.__exit__(exc_type, exc_val, exc_tb)
 
     def shutdown(self) -> None:
-        """Shutdown the executor when done with the ThreadGroup."""
-        self.executor.shutdown()
+        """Shutdown the executor when done with the ThreadGroup.
+
+        Does nothing for groups running on the shared executor.
+        """
+        if self._owns_executor:
+            self.executor.shutdown()
 
     @property
     def results(self) -> list[R]:
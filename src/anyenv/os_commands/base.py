@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import shlex
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
 
@@ -29,6 +30,10 @@ class ListDirectoryCommand(ABC):
     def create_command(self, path: str = "") -> str:
         """Generate directory listing command."""
 
+    def create_argv(self, path: str = "") -> list[str]:
+        """Split the directory listing command into an argument list (fallback for subclasses)."""
+        return shlex.split(self.create_command(path))
+
     @abstractmethod
     def parse_command(self, output: str, path: str = "") -> list[DirectoryEntry]:
         """Parse directory listing output."""
@@ -41,6 +46,10 @@ class FileInfoCommand(ABC):
     def create_command(self, path: str) -> str:
         """Generate file info command."""
 
+    def create_argv(self, path: str) -> list[str]:
+        """Split the file info command into an argument list (fallback for subclasses)."""
+        return shlex.split(self.create_command(path))
+
     @abstractmethod
     def parse_command(self, output: str, path: str) -> FileInfo:
         """Parse file info output."""
@@ -53,6 +62,10 @@ class ExistsCommand(ABC):
     def create_command(self, path: str) -> str:
         """Generate exists test command."""
 
+    def create_argv(self, path: str) -> list[str]:
+        """Split the exists test command into an argument list (fallback for subclasses)."""
+        return shlex.split(self.create_command(path))
+
     @abstractmethod
     def parse_command(self, output: str, exit_code: int = 0) -> bool:
         """Parse exists test result."""
@@ -65,6 +78,10 @@ class IsFileCommand(ABC):
     def create_command(self, path: str) -> str:
         """Generate file test command."""
 
+    def create_argv(self, path: str) -> list[str]:
+        """Split the file test command into an argument list (fallback for subclasses)."""
+        return shlex.split(self.create_command(path))
+
     @abstractmethod
     def parse_command(self, output: str, exit_code: int = 0) -> bool:
         """Parse file test result."""
@@ -77,6 +94,10 @@ class IsDirectoryCommand(ABC):
     def create_command(self, path: str) -> str:
         """Generate directory test command."""
 
+    def create_argv(self, path: str) -> list[str]:
+        """Split the directory test command into an argument list (fallback for subclasses)."""
+        return shlex.split(self.create_command(path))
+
     @abstractmethod
     def parse_command(self, output: str, exit_code: int = 0) -> bool:
         """Parse directory test result."""
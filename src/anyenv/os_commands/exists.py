@@ -19,6 +19,17 @@ class UnixExistsCommand(ExistsCommand):
         """
         return f'test -e "{path}"'
 
+    def create_argv(self, path: str) -> list[str]:
+        """Generate Unix test -e argv.
+
+        Args:
+            path: Path to test for existence
+
+        Returns:
+            The command as an argument list
+        """
+        return ["test", "-e", path]
+
     def parse_command(
         self,
         output: str,
@@ -50,6 +61,17 @@ class MacOSExistsCommand(ExistsCommand):
         """
         return f'test -e "{path}"'
 
+    def create_argv(self, path: str) -> list[str]:
+        """Generate test -e argv (same as Unix).
+
+        Args:
+            path: Path to test for existence
+
+        Returns:
+            The command as an argument list
+        """
+        return ["test", "-e", path]
+
     def parse_command(
         self,
         output: str,
@@ -81,6 +103,17 @@ class WindowsExistsCommand(ExistsCommand):
         """
         return f'powershell -c "Test-Path \\"{path}\\""'
 
+    def create_argv(self, path: str) -> list[str]:
+        """Generate PowerShell Test-Path argv.
+
+        Args:
+            path: Path to test for existence
+
+        Returns:
+            The command as an argument list
+        """
+        return ["powershell", "-c", f'Test-Path "{path}"']
+
     def parse_command(
         self,
         output: str,
@@ -32,6 +32,17 @@ class UnixFileInfoCommand(FileInfoCommand):
         """
         return f'ls -lad "{path}"'
 
+    def create_argv(self, path: str) -> list[str]:
+        """Generate ls -lad argv for file info.
+
+        Args:
+            path: Path to get information about
+
+        Returns:
+            The command as an argument list
+        """
+        return ["ls", "-lad", path]
+
     def parse_command(self, output: str, path: str) -> FileInfo:
         """Parse ls -la output for a single file/directory.
 
@@ -91,6 +102,9 @@ class UnixFileInfoCommand(FileInfoCommand):
 class MacOSFileInfoCommand(FileInfoCommand):
     """macOS file info command implementation using ls -la."""
 
+    # BSD ls output is parsed by the Unix implementation; build it once
+    _unix_cmd = UnixFileInfoCommand()
+
     def create_command(self, path: str) -> str:
         """Generate ls -la command for file info.
 
@@ -105,6 +119,17 @@ class MacOSFileInfoCommand(FileInfoCommand):
         """
         return f'ls -lad "{path}"'
 
+    def create_argv(self, path: str) -> list[str]:
+        """Generate ls -lad argv for file info.
+
+        Args:
+            path: Path to get information about
+
+        Returns:
+            The command as an argument list
+        """
+        return ["ls", "-lad", path]
+
     def parse_command(self, output: str, path: str) -> FileInfo:
         """Parse ls -la output for a single file/directory.
 
@@ -118,8 +143,7 @@ class MacOSFileInfoCommand(FileInfoCommand):
             FileInfo object with parsed information
         """
         # BSD ls output format is same as Unix
-        unix_cmd = UnixFileInfoCommand()
-        return unix_cmd.parse_command(output, path)
+        return self._unix_cmd.parse_command(output, path)
 
 
 class WindowsFileInfoCommand(FileInfoCommand):
@@ -143,6 +167,23 @@ class WindowsFileInfoCommand(FileInfoCommand):
             f'"'
         )
 
+    def create_argv(self, path: str) -> list[str]:
+        """Generate PowerShell file info argv.
+
+        Args:
+            path: Path to get information about
+
+        Returns:
+            The command as an argument list
+        """
+        script = (
+            f'$item = Get-Item "{path}" -ErrorAction Stop; '
+            '$item.Name + "||" + $item.Length + "||" + '
+            '($item.GetType().Name) + "||" + '
+            '[int][double]::Parse($item.LastWriteTime.ToString("yyyyMMddHHmmss"))'
+        )
+        return ["powershell", "-c", script]
+
     def parse_command(self, output: str, path: str) -> FileInfo:
         """Parse PowerShell output format: name||size||type||mtime.
 
@@ -10,6 +10,17 @@ from .models import DirectoryEntry
 
 EntryType = Literal["file", "directory", "link"]
 
+# Stat-printing suffixes, shared by the default fast path and the general builder.
+# Single quotes protect the format strings from shell interpretation.
+# GNU -printf: %p = path, %s = size in bytes, %T@ = mtime as unix timestamp,
+# %y = type (f=file, d=dir, l=link), %M = permissions like ls -l
+_UNIX_STATS_ARG = r"-printf '%p\t%s\t%T@\t%y\t%M\n'"
+# BSD stat: %N = path, %z = size, %m = mtime (unix timestamp),
+# %HT = type (Regular File, Directory, etc.), %Sp = permissions
+_MACOS_STATS_ARG = r"-exec stat -f '%N\t%z\t%m\t%HT\t%Sp' {} \;"
+# Output format: FullName|Length|Mode (pipe-separated for easy parsing)
+_WINDOWS_FORMAT_ARG = '| ForEach-Object { \\"$($_.FullName)|$($_.Length)|$($_.Mode)\\" }'
+
 
 class UnixFindCommand(FindCommand):
     """Unix/Linux find command implementation."""
@@ -34,6 +45,10 @@ class UnixFindCommand(FindCommand):
         Returns:
             The find command string
         """
+        if maxdepth is None and file_type == "all" and not pattern:
+            # Default shape: only the path varies
+            return f'find "{path}" {_UNIX_STATS_ARG}' if with_stats else f'find "{path}"'
+
         parts = ["find", f'"{path}"']
 
         if maxdepth is not None:
@@ -49,11 +64,7 @@ class UnixFindCommand(FindCommand):
             parts.append(f'-name "{pattern}"')
 
         if with_stats:
-            # Use -printf to get file stats in tab-separated format:
-            # %p = path, %s = size in bytes, %T@ = mtime as unix timestamp
-            # %y = type (f=file, d=dir, l=link), %M = permissions like ls -l
-            # Single quotes protect the format string from shell interpretation
-            parts.append(r"-printf '%p\t%s\t%T@\t%y\t%M\n'")
+            parts.append(_UNIX_STATS_ARG)
 
         return " ".join(parts)
 
@@ -163,6 +174,10 @@ class MacOSFindCommand(FindCommand):
         Returns:
             The find command string
         """
+        if maxdepth is None and file_type == "all" and not pattern:
+            # Default shape: only the path varies
+            return f'find "{path}" {_MACOS_STATS_ARG}' if with_stats else f'find "{path}"'
+
         parts = ["find", f'"{path}"']
 
         if maxdepth is not None:
@@ -177,11 +192,7 @@ class MacOSFindCommand(FindCommand):
             parts.append(f'-name "{pattern}"')
 
         if with_stats:
-            # BSD stat format: path\tsize\tmtime\ttype\tpermissions
-            # %N = path, %z = size, %m = mtime (unix timestamp)
-            # %HT = type (Regular File, Directory, etc.), %Sp = permissions
-            # Single quotes protect the format string from shell interpretation
-            parts.append(r"-exec stat -f '%N\t%z\t%m\t%HT\t%Sp' {} \;")
+            parts.append(_MACOS_STATS_ARG)
 
         return " ".join(parts)
 
@@ -286,6 +297,12 @@ class WindowsFindCommand(FindCommand):
         Returns:
             The PowerShell command string
         """
+        if maxdepth is None and file_type == "all" and not pattern:
+            # Default shape: only the path varies
+            return (
+                f'powershell -c "Get-ChildItem -Path \\"{path}\\" -Recurse {_WINDOWS_FORMAT_ARG}"'
+            )
+
         # Build Get-ChildItem command
         parts = [f'Get-ChildItem -Path \\"{path}\\" -Recurse']
 
@@ -303,8 +320,7 @@ class WindowsFindCommand(FindCommand):
         elif file_type == "directory":
             parts.append("-Directory")
 
-        # Output format: FullName|Length|Mode (pipe-separated for easy parsing)
-        parts.append('| ForEach-Object { \\"$($_.FullName)|$($_.Length)|$($_.Mode)\\" }')
+        parts.append(_WINDOWS_FORMAT_ARG)
 
         return f'powershell -c "{" ".join(parts)}"'
 
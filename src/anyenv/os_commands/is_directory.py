@@ -19,6 +19,17 @@ class UnixIsDirectoryCommand(IsDirectoryCommand):
         """
         return f'test -d "{path}"'
 
+    def create_argv(self, path: str) -> list[str]:
+        """Generate Unix test -d argv.
+
+        Args:
+            path: Path to test if it's a directory
+
+        Returns:
+            The command as an argument list
+        """
+        return ["test", "-d", path]
+
     def parse_command(
         self,
         output: str,
@@ -50,6 +61,17 @@ class MacOSIsDirectoryCommand(IsDirectoryCommand):
         """
         return f'test -d "{path}"'
 
+    def create_argv(self, path: str) -> list[str]:
+        """Generate test -d argv (same as Unix).
+
+        Args:
+            path: Path to test if it's a directory
+
+        Returns:
+            The command as an argument list
+        """
+        return ["test", "-d", path]
+
     def parse_command(
         self,
         output: str,
@@ -83,6 +105,21 @@ class WindowsIsDirectoryCommand(IsDirectoryCommand):
             f'powershell -c "(Get-Item \\"{path}\\" -ErrorAction SilentlyContinue).PSIsContainer"'
         )
 
+    def create_argv(self, path: str) -> list[str]:
+        """Generate PowerShell directory test argv.
+
+        Args:
+            path: Path to test if it's a directory
+
+        Returns:
+            The command as an argument list
+        """
+        return [
+            "powershell",
+            "-c",
+            f'(Get-Item "{path}" -ErrorAction SilentlyContinue).PSIsContainer',
+        ]
+
     def parse_command(
         self,
         output: str,
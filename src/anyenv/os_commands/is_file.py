@@ -19,6 +19,17 @@ class UnixIsFileCommand(IsFileCommand):
         """
         return f'test -f "{path}"'
 
+    def create_argv(self, path: str) -> list[str]:
+        """Generate Unix test -f argv.
+
+        Args:
+            path: Path to test if it's a file
+
+        Returns:
+            The command as an argument list
+        """
+        return ["test", "-f", path]
+
     def parse_command(
         self,
         output: str,
@@ -50,6 +61,17 @@ class MacOSIsFileCommand(IsFileCommand):
         """
         return f'test -f "{path}"'
 
+    def create_argv(self, path: str) -> list[str]:
+        """Generate test -f argv (same as Unix).
+
+        Args:
+            path: Path to test if it's a file
+
+        Returns:
+            The command as an argument list
+        """
+        return ["test", "-f", path]
+
     def parse_command(
         self,
         output: str,
@@ -86,6 +108,21 @@ class WindowsIsFileCommand(IsFileCommand):
             f'"'
         )
 
+    def create_argv(self, path: str) -> list[str]:
+        """Generate PowerShell file test argv.
+
+        Args:
+            path: Path to test if it's a file
+
+        Returns:
+            The command as an argument list
+        """
+        script = (
+            f'$item = Get-Item "{path}" -ErrorAction SilentlyContinue; '
+            "$item -ne $null -and -not $item.PSIsContainer"
+        )
+        return ["powershell", "-c", script]
+
     def parse_command(
         self,
         output: str,
@@ -30,6 +30,17 @@ class UnixListDirectoryCommand(ListDirectoryCommand):
         cmd = "ls -la"
         return f'{cmd} "{path}"' if path else cmd
 
+    def create_argv(self, path: str = "") -> list[str]:
+        """Generate Unix ls argv.
+
+        Args:
+            path: Directory path to list
+
+        Returns:
+            The command as an argument list
+        """
+        return ["ls", "-la", path] if path else ["ls", "-la"]
+
     def parse_command(
         self,
         output: str,
@@ -114,6 +125,9 @@ class UnixListDirectoryCommand(ListDirectoryCommand):
 class MacOSListDirectoryCommand(ListDirectoryCommand):
     """macOS list directory command implementation."""
 
+    # BSD ls output is parsed by the Unix implementation; build it once
+    _unix_cmd = UnixListDirectoryCommand()
+
     def create_command(self, path: str = "") -> str:
         """Generate BSD ls command (no --time-style support).
 
@@ -126,6 +140,17 @@ class MacOSListDirectoryCommand(ListDirectoryCommand):
         cmd = "ls -la"
         return f'{cmd} "{path}"' if path else cmd
 
+    def create_argv(self, path: str = "") -> list[str]:
+        """Generate BSD ls argv.
+
+        Args:
+            path: Directory path to list
+
+        Returns:
+            The command as an argument list
+        """
+        return ["ls", "-la", path] if path else ["ls", "-la"]
+
     def parse_command(
         self,
         output: str,
@@ -141,8 +166,7 @@ class MacOSListDirectoryCommand(ListDirectoryCommand):
             List of DirectoryEntry objects
         """
         # BSD ls output format is same as Unix, just different timestamp format
-        unix_cmd = UnixListDirectoryCommand()
-        return unix_cmd.parse_command(output, path=path)
+        return self._unix_cmd.parse_command(output, path=path)
 
 
 class WindowsListDirectoryCommand(ListDirectoryCommand):
@@ -161,6 +185,22 @@ class WindowsListDirectoryCommand(ListDirectoryCommand):
             return f'powershell -c "Get-ChildItem -Path \\"{path}\\" | Format-Table -AutoSize Name, Mode, Length, LastWriteTime"'  # noqa: E501
         return 'powershell -c "Get-ChildItem | Format-Table -AutoSize Name, Mode, Length, LastWriteTime"'  # noqa: E501
 
+    def create_argv(self, path: str = "") -> list[str]:
+        """Generate Windows PowerShell dir argv.
+
+        Args:
+            path: Directory path to list
+
+        Returns:
+            The command as an argument list
+        """
+        target = f'Get-ChildItem -Path "{path}"' if path else "Get-ChildItem"
+        return [
+            "powershell",
+            "-c",
+            f"{target} | Format-Table -AutoSize Name, Mode, Length, LastWriteTime",
+        ]
+
     def parse_command(
         self,
         output: str,
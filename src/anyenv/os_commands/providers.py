@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache, lru_cache
 import platform
 from typing import TYPE_CHECKING, Literal, overload
 
@@ -60,6 +61,7 @@ if TYPE_CHECKING:
         RemovePathCommand,
         WhichCommand,
     )
+    from .models import DirectoryEntry, FileInfo
 
 CommandType = Literal[
     "list_directory",
@@ -76,6 +78,19 @@ CommandType = Literal[
     "env_var",
     "find",
 ]
+ParsedCommandType = Literal["list_directory", "file_info", "find"]
+
+PARSE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cached(
+    command: ListDirectoryCommand | FileInfoCommand | FindCommand,
+    output: str,
+    path: str,
+) -> tuple[DirectoryEntry, ...] | FileInfo:
+    parsed = command.parse_command(output, path)
+    return tuple(parsed) if isinstance(parsed, list) else parsed
 
 
 class OSCommandProvider:
@@ -156,9 +171,49 @@ class OSCommandProvider:
         | EnvVarCommand
         | FindCommand
     ):
-        """Get command instance by type."""
+        """Get command instance by type.
+
+        Concrete providers bind this directly to ``self.commands.__getitem__``
+        to skip the extra Python frame on every lookup.
+        """
         return self.commands[command_type]
 
+    @overload
+    def parse_cached(
+        self, command_type: Literal["list_directory", "find"], output: str, path: str = ""
+    ) -> list[DirectoryEntry]: ...
+
+    @overload
+    def parse_cached(
+        self, command_type: Literal["file_info"], output: str, path: str = ""
+    ) -> FileInfo: ...
+
+    def parse_cached(
+        self, command_type: ParsedCommandType, output: str, path: str = ""
+    ) -> list[DirectoryEntry] | FileInfo:
+        """Parse command output, reusing results for identical (output, path) pairs.
+
+        Useful for polling / retry loops that see the same listing repeatedly.
+        The returned list is a fresh copy, but the entries are shared between
+        calls and should be treated as read-only.
+
+        Args:
+            command_type: Command whose parser to use
+            output: Raw command output
+            path: Path the command was run for
+
+        Returns:
+            Parsed result, as returned by the command's ``parse_command``
+        """
+        command = self.commands[command_type]
+        parsed = _parse_cached(command, output, path)
+        return list(parsed) if isinstance(parsed, tuple) else parsed
+
+    @staticmethod
+    def clear_parse_cache() -> None:
+        """Drop all cached parse results, e.g. after the filesystem changed."""
+        _parse_cached.cache_clear()
+
 
 class UnixCommandProvider(OSCommandProvider):
     """Unix/Linux command provider using GNU/POSIX tools."""
@@ -181,6 +236,7 @@ class UnixCommandProvider(OSCommandProvider):
             "env_var": UnixEnvVarCommand(),
             "find": UnixFindCommand(),
         }
+        self.get_command = self.commands.__getitem__  # type: ignore[method-assign,assignment]
 
 
 class MacOSCommandProvider(OSCommandProvider):
@@ -204,6 +260,7 @@ class MacOSCommandProvider(OSCommandProvider):
             "env_var": MacOSEnvVarCommand(),
             "find": MacOSFindCommand(),
         }
+        self.get_command = self.commands.__getitem__  # type: ignore[method-assign,assignment]
 
 
 class WindowsCommandProvider(OSCommandProvider):
@@ -227,13 +284,23 @@ class WindowsCommandProvider(OSCommandProvider):
             "env_var": WindowsEnvVarCommand(),
             "find": WindowsFindCommand(),
         }
+        self.get_command = self.commands.__getitem__  # type: ignore[method-assign,assignment]
 
 
+_PROVIDERS: dict[str, type[OSCommandProvider]] = {
+    "Windows": WindowsCommandProvider,
+    "Darwin": MacOSCommandProvider,
+}
+
+
+@cache
 def get_os_command_provider(
     system: Literal["Windows", "Darwin", "Linux"] | None = None,
 ) -> OSCommandProvider:
     """Auto-detect OS and return appropriate command provider.
 
+    Providers are stateless, so one shared instance is returned per system.
+
     Args:
         system: The system to use. If None, the current system is used.
 
@@ -241,10 +308,5 @@ def get_os_command_provider(
         OS-specific command provider based on current platform
     """
     system_ = system or platform.system()
-
-    if system_ == "Windows":
-        return WindowsCommandProvider()
-    if system_ == "Darwin":  # macOS
-        return MacOSCommandProvider()
-    # Linux and other Unix-like systems
-    return UnixCommandProvider()
+    # Linux and other Unix-like systems fall back to the GNU/POSIX provider
+    return _PROVIDERS.get(system_, UnixCommandProvider)()
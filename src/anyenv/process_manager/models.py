@@ -20,3 +20,4 @@ class ProcessOutput:
     truncated: bool = False
     exit_code: int | None = None
     signal: str | None = None
+    stdout_bytes: int = 0
@@ -33,13 +33,16 @@ class RunningProcess:
     _stdout_buffer: list[str] = field(default_factory=list)
     _stderr_buffer: list[str] = field(default_factory=list)
     _output_size: int = 0
+    _stdout_size: int = 0
     _truncated: bool = False
 
     def add_output(self, stdout: str = "", stderr: str = "") -> None:
         """Add output to buffers, applying size limits."""
         if stdout:
             self._stdout_buffer.append(stdout)
-            self._output_size += len(stdout.encode())
+            stdout_size = len(stdout.encode())
+            self._stdout_size += stdout_size
+            self._output_size += stdout_size
         if stderr:
             self._stderr_buffer.append(stderr)
             self._output_size += len(stderr.encode())
@@ -62,21 +65,19 @@ class RunningProcess:
         target_size = int(self.output_limit * 0.9)  # Keep 90% of limit
 
         # Truncate stdout first, then stderr if needed
-        if len(all_stdout.encode()) > target_size:
+        stdout_size = len(all_stdout.encode())
+        if stdout_size > target_size:
             # Find character boundary for truncation
-            truncated_stdout = all_stdout[-target_size:].lstrip()
-            self._stdout_buffer = [truncated_stdout]
-            self._stderr_buffer = [all_stderr]
+            all_stdout = all_stdout[-target_size:].lstrip()
+            stdout_size = len(all_stdout.encode())
         else:
-            remaining = target_size - len(all_stdout.encode())
-            truncated_stderr = all_stderr[-remaining:].lstrip()
-            self._stdout_buffer = [all_stdout]
-            self._stderr_buffer = [truncated_stderr]
-
-        # Update size counter
-        self._output_size = sum(
-            len(chunk.encode()) for chunk in self._stdout_buffer + self._stderr_buffer
-        )
+            all_stderr = all_stderr[-(target_size - stdout_size) :].lstrip()
+        self._stdout_buffer = [all_stdout]
+        self._stderr_buffer = [all_stderr]
+
+        # Update size counters
+        self._stdout_size = stdout_size
+        self._output_size = stdout_size + len(all_stderr.encode())
 
     def get_output(self) -> ProcessOutput:
         """Get current process output."""
@@ -90,6 +91,7 @@ class RunningProcess:
             truncated=self._truncated,
             exit_code=self.process.returncode,
             signal=None,  # TODO: Extract signal info if available,
+            stdout_bytes=self._stdout_size,
         )
 
     async def is_running(self) -> bool:
@@ -121,51 +121,27 @@ class ProcessManager(ProcessManagerProtocol):
     async def _collect_output(self, proc: RunningProcess) -> None:
         """Collect output from process in background."""
         try:
-            stdout_task = asyncio.create_task(self._read_stream(proc.process.stdout))
-            stderr_task = asyncio.create_task(self._read_stream(proc.process.stderr))
-            stdout_chunks = []
-            stderr_chunks = []
-            stdout_done = False
-            stderr_done = False
-            while not (stdout_done and stderr_done):
-                done, pending = await asyncio.wait(
-                    [stdout_task, stderr_task],
-                    return_when=asyncio.FIRST_COMPLETED,
-                    timeout=0.1,  # Check every 100ms
-                )
-
-                for task in done:
-                    if task == stdout_task and not stdout_done:
-                        chunk = task.result()
-                        if chunk is None:
-                            stdout_done = True
-                        else:
-                            stdout_chunks.append(chunk)
-                            proc.add_output(stdout=chunk)
-                            # Restart task for next chunk
-                            stdout_task = asyncio.create_task(
-                                self._read_stream(proc.process.stdout)
-                            )
-
-                    elif task == stderr_task and not stderr_done:
-                        chunk = task.result()
-                        if chunk is None:
-                            stderr_done = True
-                        else:
-                            stderr_chunks.append(chunk)
-                            proc.add_output(stderr=chunk)
-                            # Restart task for next chunk
-                            stderr_task = asyncio.create_task(
-                                self._read_stream(proc.process.stderr)
-                            )
-
-            # Cancel any remaining tasks
-            for task in pending:
-                task.cancel()
-
+            await asyncio.gather(
+                self._pump_stream(proc.process.stdout, proc),
+                self._pump_stream(proc.process.stderr, proc, stderr=True),
+            )
         except Exception:
             logger.exception("Error collecting output for %s", proc.process_id)
 
+    async def _pump_stream(
+        self,
+        stream: asyncio.StreamReader | None,
+        proc: RunningProcess,
+        *,
+        stderr: bool = False,
+    ) -> None:
+        """Feed chunks from a stream into the process buffers until EOF."""
+        while (chunk := await self._read_stream(stream)) is not None:
+            if stderr:
+                proc.add_output(stderr=chunk)
+            else:
+                proc.add_output(stdout=chunk)
+
     async def _read_stream(self, stream: asyncio.StreamReader | None) -> str | None:
         """Read a chunk from a stream."""
         if not stream:
@@ -198,6 +174,9 @@ class ProcessManager(ProcessManagerProtocol):
     async def wait_for_exit(self, process_id: str) -> int:
         """Wait for process to complete.
 
+        Also waits for the output collection to reach EOF, so a following
+        get_output() call returns the complete output.
+
         Args:
             process_id: Process identifier
 
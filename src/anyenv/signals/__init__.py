@@ -22,6 +22,11 @@ Example using bounded TypeVar for type-safe signals:
         file_saved = AppSignal[FileEvent]()   # ✅ OK
         invalid = AppSignal[dict]()           # ❌ Type error!
     ```
+
+Emitting calls sync handlers in connection order, then runs async handlers
+concurrently, and raises their errors as an ``ExceptionGroup``. Earlier versions
+awaited async handlers one after another and raised the first error unchanged,
+so ``except SomeError`` around ``emit`` needs to become ``except* SomeError``.
 """
 
 from __future__ import annotations
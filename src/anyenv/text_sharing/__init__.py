@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Literal, assert_never, overload
+from functools import cache
+from typing import Literal, overload
 
 from anyenv.text_sharing.base import ShareResult, TextSharer, Visibility
 from anyenv.text_sharing.github_gist import GistSharer
@@ -14,6 +15,23 @@ from anyenv.text_sharing.shittycodingagent import ShittyCodingAgentSharer
 
 TextSharerStr = Literal["gist", "pastebin", "paste_rs", "opencode", "shittycodingagent"]
 
+_SHARERS: dict[TextSharerStr, type[TextSharer]] = {
+    "gist": GistSharer,
+    "pastebin": PastebinSharer,
+    "paste_rs": PasteRsSharer,
+    "opencode": OpenCodeSharer,
+    "shittycodingagent": ShittyCodingAgentSharer,
+}
+# Providers without constructor arguments or per-instance state (credentials read
+# from the environment, HTTP clients that get closed), safe to share one instance.
+_STATELESS_SHARERS: frozenset[TextSharerStr] = frozenset({"paste_rs"})
+
+
+@cache
+def _get_shared_sharer(provider: TextSharerStr) -> TextSharer:
+    """Return the process-wide instance of a stateless sharer."""
+    return _SHARERS[provider]()
+
 
 @overload
 def get_sharer(
@@ -64,7 +82,11 @@ def get_sharer(
         **kwargs: Keyword arguments to pass to the provider constructor
 
     Returns:
-        An instance of the specified text sharer
+        An instance of the specified text sharer. Stateless providers
+        (currently paste.rs) return a shared instance.
+
+    Raises:
+        ValueError: If the provider is unknown
 
     Example:
         ```python
@@ -90,19 +112,14 @@ def get_sharer(
         sharer = get_sharer("opencode", api_url="https://api.dev.opencode.ai")
         ```
     """
-    match provider:
-        case "gist":
-            return GistSharer(**kwargs)
-        case "pastebin":
-            return PastebinSharer(**kwargs)
-        case "paste_rs":
-            return PasteRsSharer()
-        case "opencode":
-            return OpenCodeSharer(**kwargs)  # type: ignore[arg-type]
-        case "shittycodingagent":
-            return ShittyCodingAgentSharer(**kwargs)
-        case _ as unreachable:
-            assert_never(unreachable)
+    if provider in _STATELESS_SHARERS:
+        return _get_shared_sharer(provider)
+    try:
+        sharer_cls = _SHARERS[provider]
+    except KeyError:
+        msg = f"Unknown text sharing provider: {provider}"
+        raise ValueError(msg) from None
+    return sharer_cls(**kwargs)
 
 
 __all__ = [
@@ -24,13 +24,17 @@ text and conversations.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
+import importlib.util
 import time
-from typing import TYPE_CHECKING, Literal, Self
+from typing import TYPE_CHECKING, Any, Literal, NoReturn, Self
 import uuid
+from weakref import WeakKeyDictionary, finalize
 
 import httpx
 
+from anyenv.json_tools import JsonLoadError, dump_json, load_json
 from anyenv.text_sharing.base import ShareResult, TextSharer
 
 
@@ -40,6 +44,67 @@ if TYPE_CHECKING:
 
 MessageRole = Literal["user", "assistant", "system"]
 
+# HTTP/2 lets the create/sync requests of a share multiplex over one connection,
+# but httpx only supports it when the optional `h2` package is installed.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+type _ClientKey = tuple[str, float, asyncio.AbstractEventLoop]
+
+# Clients shared by all sharers with the same (api_url, timeout) on the same event
+# loop, with their reference counts, so several sharers reuse one connection pool
+# and TLS setup without carrying connections over from another loop. Keyed weakly
+# by loop, so the clients of a discarded loop go away with it.
+_SHARED_CLIENTS: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, float], tuple[httpx.AsyncClient, int]]
+] = WeakKeyDictionary()
+
+
+def _acquire_client(key: _ClientKey) -> httpx.AsyncClient:
+    """Return the shared client for key, creating it on first use."""
+    api_url, timeout, loop = key
+    clients = _SHARED_CLIENTS.setdefault(loop, {})
+    if (api_url, timeout) in clients:
+        client, refs = clients[api_url, timeout]
+    else:
+        client = httpx.AsyncClient(
+            base_url=api_url,
+            timeout=timeout,
+            headers={"Content-Type": "application/json"},
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        refs = 0
+    clients[api_url, timeout] = (client, refs + 1)
+    return client
+
+
+def _drop_client(key: _ClientKey) -> httpx.AsyncClient | None:
+    """Drop one reference to the shared client for key, returning it if it was the last.
+
+    Also used as the finalizer of sharers that are garbage-collected unclosed; the
+    client is then left to be collected like an unshared one.
+    """
+    api_url, timeout, loop = key
+    clients = _SHARED_CLIENTS.get(loop)
+    if clients is None or (api_url, timeout) not in clients:
+        return None
+    client, refs = clients.pop((api_url, timeout))
+    if refs > 1:
+        clients[api_url, timeout] = (client, refs - 1)
+        return None
+    return client
+
+
+async def _release_client(key: _ClientKey) -> None:
+    """Drop one reference to the shared client for key, closing it with the last.
+
+    A client created on another loop is only dropped, as its connections cannot
+    be closed from the current one.
+    """
+    client = _drop_client(key)
+    if client is not None and key[2] is asyncio.get_running_loop():
+        await client.aclose()
+
 
 @dataclass
 class MessagePart:
@@ -91,6 +156,17 @@ class Message:
         return cls(role=role, parts=[MessagePart(type="text", text=text)])
 
 
+def _raise_api_error(resp: httpx.Response) -> NoReturn:
+    """Translate an error response of the OpenCode API into a RuntimeError."""
+    if resp.status_code == 404:  # noqa: PLR2004
+        msg = "OpenCode API endpoint not found - service may be unavailable"
+    elif resp.status_code == 429:  # noqa: PLR2004
+        msg = "Rate limited by OpenCode API"
+    else:
+        msg = f"OpenCode API error (HTTP {resp.status_code}): {resp.text}"
+    raise RuntimeError(msg)
+
+
 class OpenCodeSharer(TextSharer):
     """OpenCode text sharing service.
 
@@ -133,13 +209,19 @@ class OpenCodeSharer(TextSharer):
     ) -> None:
         """Initialize OpenCode sharer.
 
+        Sharers with the same API URL and timeout share one HTTP client per event
+        loop. It is acquired on the first request and closed when the last of its
+        sharers is closed; sharers collected without being closed just drop their
+        reference.
+
         Args:
             api_url: OpenCode API URL (defaults to production)
             timeout: Request timeout in seconds
         """
         self.api_url = api_url or "https://api.opencode.ai"
         self.timeout = timeout
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self._client_key: _ClientKey | None = None
+        self._finalizer: finalize[..., Any] | None = None
 
     @property
     def name(self) -> str:
@@ -174,12 +256,8 @@ class OpenCodeSharer(TextSharer):
             current_time = int(time.time() * 1000)
 
             # Create share (returns secret and URL)
-            resp = await self._client.post(
-                f"{self.api_url}/share_create",
-                json={"sessionID": session_id},
-            )
-            resp.raise_for_status()
-            share_data = resp.json()
+            resp = await self._post("/share_create", {"sessionID": session_id})
+            share_data = load_json(resp.content)
             secret = share_data["secret"]
             share_url = share_data["url"]
 
@@ -197,16 +275,15 @@ class OpenCodeSharer(TextSharer):
                 },
             }
 
-            resp = await self._client.post(
-                f"{self.api_url}/share_sync",
-                json={
+            await self._post(
+                "/share_sync",
+                {
                     "sessionID": session_id,
                     "secret": secret,
                     "key": info_key,
                     "content": info_content,
                 },
             )
-            resp.raise_for_status()
 
             # Sync message
             msg_key = f"session/message/{session_id}/{message_id}"
@@ -217,16 +294,15 @@ class OpenCodeSharer(TextSharer):
                 "time": {"created": current_time},
             }
 
-            resp = await self._client.post(
-                f"{self.api_url}/share_sync",
-                json={
+            await self._post(
+                "/share_sync",
+                {
                     "sessionID": session_id,
                     "secret": secret,
                     "key": msg_key,
                     "content": msg_content,
                 },
             )
-            resp.raise_for_status()
 
             # Sync text part with actual content
             part_key = f"session/part/{session_id}/{message_id}/{part_id}"
@@ -238,16 +314,15 @@ class OpenCodeSharer(TextSharer):
                 "text": content,
             }
 
-            resp = await self._client.post(
-                f"{self.api_url}/share_sync",
-                json={
+            await self._post(
+                "/share_sync",
+                {
                     "sessionID": session_id,
                     "secret": secret,
                     "key": part_key,
                     "content": part_content,
                 },
             )
-            resp.raise_for_status()
 
             # Store secret in delete_url for later deletion
             delete_url = f"{self.api_url}/share_delete#{secret}"
@@ -259,18 +334,12 @@ class OpenCodeSharer(TextSharer):
                 id=session_id,
             )
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:  # noqa: PLR2004
-                msg = "OpenCode API endpoint not found - service may be unavailable"
-                raise RuntimeError(msg) from e
-            if e.response.status_code == 429:  # noqa: PLR2004
-                msg = "Rate limited by OpenCode API"
-                raise RuntimeError(msg) from e
-            msg = f"OpenCode API error (HTTP {e.response.status_code}): {e.response.text}"
-            raise RuntimeError(msg) from e
         except httpx.RequestError as e:
             msg = f"Failed to connect to OpenCode API: {e}"
             raise RuntimeError(msg) from e
+        except JsonLoadError as e:
+            msg = f"Invalid response from OpenCode API: {e}"
+            raise RuntimeError(msg) from e
 
     async def share_conversation(
         self,
@@ -312,12 +381,8 @@ class OpenCodeSharer(TextSharer):
             current_time = int(time.time() * 1000)
 
             # Create share
-            resp = await self._client.post(
-                f"{self.api_url}/share_create",
-                json={"sessionID": session_id},
-            )
-            resp.raise_for_status()
-            share_data = resp.json()
+            resp = await self._post("/share_create", {"sessionID": session_id})
+            share_data = load_json(resp.content)
             secret = share_data["secret"]
             share_url = share_data["url"]
 
@@ -335,16 +400,15 @@ class OpenCodeSharer(TextSharer):
                 },
             }
 
-            resp = await self._client.post(
-                f"{self.api_url}/share_sync",
-                json={
+            await self._post(
+                "/share_sync",
+                {
                     "sessionID": session_id,
                     "secret": secret,
                     "key": info_key,
                     "content": info_content,
                 },
             )
-            resp.raise_for_status()
 
             # Sync each message and its parts
             for msg_idx, message in enumerate(messages):
@@ -360,16 +424,15 @@ class OpenCodeSharer(TextSharer):
                     "time": {"created": msg_time},
                 }
 
-                resp = await self._client.post(
-                    f"{self.api_url}/share_sync",
-                    json={
+                await self._post(
+                    "/share_sync",
+                    {
                         "sessionID": session_id,
                         "secret": secret,
                         "key": msg_key,
                         "content": msg_content,
                     },
                 )
-                resp.raise_for_status()
 
                 # Sync each part
                 for part in message.parts:
@@ -383,16 +446,15 @@ class OpenCodeSharer(TextSharer):
                         "text": part.text,
                     }
 
-                    resp = await self._client.post(
-                        f"{self.api_url}/share_sync",
-                        json={
+                    await self._post(
+                        "/share_sync",
+                        {
                             "sessionID": session_id,
                             "secret": secret,
                             "key": part_key,
                             "content": part_content,
                         },
                     )
-                    resp.raise_for_status()
 
             # Store secret in delete_url for later deletion
             delete_url = f"{self.api_url}/share_delete#{secret}"
@@ -404,18 +466,12 @@ class OpenCodeSharer(TextSharer):
                 id=session_id,
             )
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:  # noqa: PLR2004
-                msg = "OpenCode API endpoint not found - service may be unavailable"
-                raise RuntimeError(msg) from e
-            if e.response.status_code == 429:  # noqa: PLR2004
-                msg = "Rate limited by OpenCode API"
-                raise RuntimeError(msg) from e
-            msg = f"OpenCode API error (HTTP {e.response.status_code}): {e.response.text}"
-            raise RuntimeError(msg) from e
         except httpx.RequestError as e:
             msg = f"Failed to connect to OpenCode API: {e}"
             raise RuntimeError(msg) from e
+        except JsonLoadError as e:
+            msg = f"Invalid response from OpenCode API: {e}"
+            raise RuntimeError(msg) from e
 
     async def delete_share(self, result: ShareResult) -> bool:
         """Delete a shared session.
@@ -432,23 +488,51 @@ class OpenCodeSharer(TextSharer):
         # Extract secret from delete_url
         secret = result.delete_url.split("#", 1)[1]
 
+        payload = {"sessionID": result.id, "secret": secret}
         try:
-            resp = await self._client.post(
-                f"{self.api_url}/share_delete",
-                json={
-                    "sessionID": result.id,
-                    "secret": secret,
-                },
-            )
-            resp.raise_for_status()
+            client = await self._get_client()
+            resp = await client.post("/share_delete", content=dump_json(payload))
         except httpx.HTTPError:
             return False
-        else:
-            return True
+        return not resp.is_error
+
+    async def _post(self, path: str, payload: dict[str, Any]) -> httpx.Response:
+        """POST a JSON payload, serialized with the fastest available JSON backend.
+
+        Args:
+            path: API path relative to the API URL
+            payload: JSON-serializable request body
+
+        Returns:
+            The successful response
+
+        Raises:
+            RuntimeError: If the API returns an error status
+        """
+        client = await self._get_client()
+        resp = await client.post(path, content=dump_json(payload))
+        if resp.is_error:
+            _raise_api_error(resp)
+        return resp
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client for the running loop, switching over if it changed."""
+        key = (self.api_url, self.timeout, asyncio.get_running_loop())
+        if self._client_key == key:
+            return _SHARED_CLIENTS[key[2]][key[0], key[1]][0]
+        await self.close()
+        self._client_key = key
+        self._finalizer = finalize(self, _drop_client, key)
+        return _acquire_client(key)
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Release the HTTP client, closing it once no other sharer uses it."""
+        if self._client_key is not None:
+            key, self._client_key = self._client_key, None
+            if self._finalizer is not None:
+                self._finalizer.detach()
+                self._finalizer = None
+            await _release_client(key)
 
     async def __aenter__(self) -> Self:
         return self
@@ -458,7 +542,6 @@ class OpenCodeSharer(TextSharer):
 
 
 if __name__ == "__main__":
-    import asyncio
 
     async def main() -> None:
         """Test OpenCode sharing functionality."""
@@ -12,23 +12,29 @@ from upath import UPath
 from anyenv.toml_tools.base import TomlDumpError, TomlLoadError, TomlProviderBase
 
 
+_LINE_COL_RE = re.compile(r"at line (\d+)[,]? column (\d+)")
+_LINE_RE = re.compile(r"line (\d+)")
+
+
 def _extract_rtoml_error_info(exc: Exception) -> tuple[str, int | None, int | None]:
     """Extract line and column info from rtoml error message.
 
     rtoml errors may include position info in various formats.
     """
     msg = str(exc)
+    if "line " not in msg:  # both patterns below need it, skip the regex scans
+        return msg, None, None
     line: int | None = None
     column: int | None = None
 
     # Try pattern "at line X column Y" or "(at line X, column Y)"
-    match = re.search(r"at line (\d+)[,]? column (\d+)", msg)
+    match = _LINE_COL_RE.search(msg)
     if match:
         line = int(match.group(1))
         column = int(match.group(2))
     else:
         # Try pattern "line X"
-        match = re.search(r"line (\d+)", msg)
+        match = _LINE_RE.search(msg)
         if match:
             line = int(match.group(1))
 
@@ -2,55 +2,78 @@
 
 from __future__ import annotations
 
-from io import BytesIO, TextIOWrapper
+from io import TextIOWrapper
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import toml_rs
 from upath import UPath
 
 from anyenv.toml_tools.base import TomlLoadError, TomlProviderBase
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _read_path(data: Path | UPath) -> str:
+    """Read a TOML file as UTF-8 text."""
+    return data.read_text(encoding="utf-8")
+
+
+def _read_str(data: str) -> str:
+    """Return TOML text unchanged."""
+    return data
+
+
+# Text readers keyed by input type. Subclasses (e.g. PosixPath or the UPath
+# flavours) are resolved via isinstance once and then cached under their type.
+_READERS: dict[type[Any], Callable[[Any], str]] = {
+    str: _read_str,
+    bytes: bytes.decode,
+    TextIOWrapper: TextIOWrapper.read,
+    Path: _read_path,
+    UPath: _read_path,
+}
+
+
+def _get_reader(data: object) -> Callable[[Any], str]:
+    """Return the text reader for the type of data."""
+    data_type = type(data)
+    reader = _READERS.get(data_type)
+    if reader is None:
+        for base, base_reader in list(_READERS.items()):
+            if isinstance(data, base):
+                reader = _READERS[data_type] = base_reader
+                break
+        else:
+            msg = f"Cannot load TOML from {data_type.__name__}"
+            raise TypeError(msg)
+    return reader
+
+
 class TomlRsProvider(TomlProviderBase):
     """TOML-RS implementation of the TOML provider interface."""
 
     @staticmethod
     def load_toml(data: str | bytes | TextIOWrapper | Path | UPath) -> Any:
         """Load TOML using toml_rs."""
-        import toml_rs
-
+        source = _get_reader(data)(data)
         try:
-            source_content: str | None = None
-            source_path: Path | UPath | None = None
-            match data:
-                case Path() | UPath():
-                    source_path = data
-                    bytes_data = data.read_bytes()
-                    source_content = bytes_data.decode(errors="replace")
-                    return toml_rs.load(BytesIO(bytes_data))
-                case TextIOWrapper():
-                    content = data.read()
-                    source_content = content
-                    return toml_rs.loads(content)
-                case bytes():
-                    content = data.decode()
-                    source_content = content
-                    return toml_rs.loads(content)
-                case str():
-                    source_content = data
-                    return toml_rs.loads(data)
+            return toml_rs.loads(source)
         except toml_rs.TOMLDecodeError as exc:
+            source_path = data if isinstance(data, Path | UPath) else None
             raise TomlLoadError(  # noqa: TRY003
                 f"Invalid TOML: {exc.msg}",
                 line=exc.lineno,
                 column=exc.colno,
                 source_path=str(source_path) if isinstance(source_path, UPath) else source_path,
-                source_content=source_content,
+                source_content=source,
             ) from exc
 
     @staticmethod
     def dump_toml(data: Any, *, pretty: bool = False) -> str:
         """Dump data to TOML string using toml_rs."""
-        import toml_rs
-
+        if isinstance(data, dict) and not data:
+            return ""  # an empty table serializes to an empty document
         return toml_rs.dumps(data, pretty=pretty)
@@ -12,6 +12,10 @@ from upath import UPath
 from anyenv.toml_tools.base import TomlDumpError, TomlLoadError, TomlProviderBase
 
 
+_PAREN_LINE_COL_RE = re.compile(r"\(at line (\d+), column (\d+)\)")
+_LINE_COL_RE = re.compile(r"at line (\d+), column (\d+)")
+
+
 def _extract_tomllib_error_info(
     exc: Exception, source: str | None
 ) -> tuple[str, int | None, int | None]:
@@ -25,13 +29,13 @@ def _extract_tomllib_error_info(
     column: int | None = None
 
     # Try pattern "(at line X, column Y)"
-    match = re.search(r"\(at line (\d+), column (\d+)\)", msg)
+    match = _PAREN_LINE_COL_RE.search(msg)
     if match:
         line = int(match.group(1))
         column = int(match.group(2))
     else:
         # Try pattern "at line X, column Y" without parentheses
-        match = re.search(r"at line (\d+), column (\d+)", msg)
+        match = _LINE_COL_RE.search(msg)
         if match:
             line = int(match.group(1))
             column = int(match.group(2))
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
+import functools
 import time
 from typing import Any
 from unittest.mock import Mock
@@ -36,6 +37,10 @@ class ExceptionEvent:
     error_message: str
 
 
+def _noop(index: int, event: Any) -> None:
+    """Do nothing; bound to an index via functools.partial to create distinct handlers."""
+
+
 async def test_handler_exception_propagation():
     """Test that handler exceptions propagate as expected."""
     handler_calls: list[tuple[str, Any]] = []
@@ -99,23 +104,23 @@ async def test_observer_mode_with_mixed_handler_speeds():
     mixed_speed_events[SlowEvent].connect(async_slow_handler)
     # Test sequential mode
     mixed_speed_events.observer_mode = "sequential"
-    start_time = asyncio.get_event_loop().time()
+    start_time = time.perf_counter()
 
     async for _ in mixed_speed_events():
         pass
 
-    sequential_duration = asyncio.get_event_loop().time() - start_time
+    sequential_duration = time.perf_counter() - start_time
     sequential_calls = len(handler_calls)
     # Clear for parallel test
     handler_calls.clear()
     # Test parallel mode
     mixed_speed_events.observer_mode = "parallel"
-    start_time = asyncio.get_event_loop().time()
+    start_time = time.perf_counter()
 
     async for _ in mixed_speed_events():
         pass
 
-    parallel_duration = asyncio.get_event_loop().time() - start_time
+    parallel_duration = time.perf_counter() - start_time
     parallel_calls = len(handler_calls)
     # Both modes should call all handlers
     assert (
@@ -228,8 +233,8 @@ async def test_handler_performance_under_load():
                 yield FastEvent(i)
 
     # Create many handlers
-    slow_handlers = [lambda e, idx=i: None for i in range(50)]
-    fast_handlers = [lambda e, idx=i: None for i in range(50)]
+    slow_handlers = [functools.partial(_noop, i) for i in range(50)]
+    fast_handlers = [functools.partial(_noop, i) for i in range(50)]
 
     # Connect all handlers
     for handler in slow_handlers:
@@ -237,13 +242,13 @@ async def test_handler_performance_under_load():
     for handler in fast_handlers:
         high_volume_stream[FastEvent].connect(handler)
 
-    start_time = asyncio.get_event_loop().time()
+    start_time = time.perf_counter()
     # Process stream
     event_count = 0
     async for _ in high_volume_stream():
         event_count += 1
 
-    duration = asyncio.get_event_loop().time() - start_time
+    duration = time.perf_counter() - start_time
     # Verify all events processed
     assert event_count == 1000  # noqa: PLR2004
     # Should complete in reasonable time (this is environment dependent)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
+import functools
 from typing import Any
 
 import pytest
@@ -44,6 +45,10 @@ class CompleteEvent:
     duration: float
 
 
+def _noop(index: int, event: Any) -> None:
+    """Do nothing; bound to an index via functools.partial to create distinct handlers."""
+
+
 async def test_single_event_type_filtering():
     """Test filtering for single event types."""
     captured_events: list[tuple[str, Any]] = []
@@ -324,7 +329,7 @@ async def test_memory_cleanup_on_disconnect():
         yield NetworkEvent("test", "localhost")
 
     # Create many handlers and connect them
-    handlers = [lambda e, i=i: None for i in range(100)]
+    handlers = [functools.partial(_noop, i) for i in range(100)]
 
     for handler in handlers:
         cleanup_test[NetworkEvent].connect(handler)
@@ -4,19 +4,26 @@ from __future__ import annotations
 
 from pathlib import Path
 import subprocess
+import sys
 import tempfile
 from typing import TYPE_CHECKING
 
 import pytest
 
-from anyenv.os_commands.providers import get_os_command_provider
+from anyenv.os_commands import ExistsCommand
+from anyenv.os_commands.providers import (
+    MacOSCommandProvider,
+    UnixCommandProvider,
+    WindowsCommandProvider,
+    get_os_command_provider,
+)
 
 
 if TYPE_CHECKING:
     from anyenv.os_commands import OSCommandProvider
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def provider():
     """Get OS command provider for current platform."""
     return get_os_command_provider()
@@ -45,6 +52,39 @@ def test_subdir(temp_dir):
     return subdir
 
 
+def test_provider_dispatch():
+    """Test provider selection per system and instance reuse."""
+    assert isinstance(get_os_command_provider("Windows"), WindowsCommandProvider)
+    assert isinstance(get_os_command_provider("Darwin"), MacOSCommandProvider)
+    assert isinstance(get_os_command_provider("Linux"), UnixCommandProvider)
+    assert get_os_command_provider("Linux") is get_os_command_provider("Linux")
+
+
+def test_create_argv_default_splits_command():
+    """Test that command subclasses without create_argv split their command string."""
+
+    class PlainExistsCommand(ExistsCommand):
+        def create_command(self, path: str) -> str:
+            return f'test -e "{path}"'
+
+        def parse_command(self, output: str, exit_code: int = 0) -> bool:
+            return exit_code == 0
+
+    assert PlainExistsCommand().create_argv("/tmp/a b") == ["test", "-e", "/tmp/a b"]
+
+
+@pytest.mark.parametrize("provider_cls", [UnixCommandProvider, MacOSCommandProvider])
+def test_create_argv_keeps_special_characters(provider_cls: type[OSCommandProvider]):
+    """Test that POSIX argv commands pass quotes, backslashes and spaces through unchanged."""
+    path = '/tmp/q"uote dir\\name'
+    provider = provider_cls()
+    assert provider.get_command("exists").create_argv(path) == ["test", "-e", path]
+    assert provider.get_command("is_file").create_argv(path) == ["test", "-f", path]
+    assert provider.get_command("is_directory").create_argv(path) == ["test", "-d", path]
+    assert provider.get_command("file_info").create_argv(path) == ["ls", "-lad", path]
+    assert provider.get_command("list_directory").create_argv(path) == ["ls", "-la", path]
+
+
 def run_command(cmd: str) -> tuple[str, int]:
     """Run a command and return output and exit code."""
     try:
@@ -55,6 +95,26 @@ def run_command(cmd: str) -> tuple[str, int]:
         return result.stdout, result.returncode
 
 
+def run_argv(argv: list[str]) -> tuple[str, int]:
+    """Run an argument list without a shell and return output and exit code."""
+    try:
+        result = subprocess.run(argv, capture_output=True, text=True, timeout=10)
+    except subprocess.TimeoutExpired:
+        return "", 1
+    else:
+        return result.stdout, result.returncode
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="quotes are not valid in Windows file names")
+def test_exists_argv_with_quoted_path(provider: OSCommandProvider, temp_dir: Path):
+    """Test that a path with quotes and spaces is found when run via argv."""
+    quoted = temp_dir / 'q"uote file.txt'
+    quoted.write_text("content")
+
+    output, exit_code = run_argv(provider.get_command("exists").create_argv(str(quoted)))
+    assert provider.get_command("exists").parse_command(output, exit_code) is True
+
+
 def test_list_directory_command(
     provider: OSCommandProvider,
     temp_dir: Path,
@@ -66,9 +126,11 @@ def test_list_directory_command(
     cmd = provider.get_command("list_directory").create_command(str(temp_dir))
     assert isinstance(cmd, str)
     assert str(temp_dir) in cmd
+    argv = provider.get_command("list_directory").create_argv(str(temp_dir))
+    assert str(temp_dir) in argv[-1]
 
     # Execute command
-    output, exit_code = run_command(cmd)
+    output, exit_code = run_argv(argv)
     assert exit_code == 0
     assert output.strip()
 
@@ -88,17 +150,19 @@ def test_exists_command(provider: OSCommandProvider, test_file: Path, temp_dir:
     cmd = provider.get_command("exists").create_command(str(test_file))
     assert isinstance(cmd, str)
     assert str(test_file) in cmd
+    argv = provider.get_command("exists").create_argv(str(test_file))
+    assert str(test_file) in argv[-1]
 
-    output, exit_code = run_command(cmd)
+    output, exit_code = run_argv(argv)
     result = provider.get_command("exists").parse_command(output, exit_code)
     assert result is True
 
     # Test non-existing file
     non_existing = temp_dir / "nonexistent.txt"
-    cmd = provider.get_command("exists").create_command(str(non_existing))
-    assert str(non_existing) in cmd
+    argv = provider.get_command("exists").create_argv(str(non_existing))
+    assert str(non_existing) in argv[-1]
 
-    output, exit_code = run_command(cmd)
+    output, exit_code = run_argv(argv)
     result = provider.get_command("exists").parse_command(output, exit_code)
     assert result is False
 
@@ -109,16 +173,18 @@ def test_is_file_command(provider: OSCommandProvider, test_file: Path, test_subd
     cmd = provider.get_command("is_file").create_command(str(test_file))
     assert isinstance(cmd, str)
     assert str(test_file) in cmd
+    argv = provider.get_command("is_file").create_argv(str(test_file))
+    assert str(test_file) in argv[-1]
 
-    output, exit_code = run_command(cmd)
+    output, exit_code = run_argv(argv)
     result = provider.get_command("is_file").parse_command(output, exit_code)
     assert result is True
 
     # Test directory (should be False)
-    cmd = provider.get_command("is_file").create_command(str(test_subdir))
-    assert str(test_subdir) in cmd
+    argv = provider.get_command("is_file").create_argv(str(test_subdir))
+    assert str(test_subdir) in argv[-1]
 
-    output, exit_code = run_command(cmd)
+    output, exit_code = run_argv(argv)
     result = provider.get_command("is_file").parse_command(output, exit_code)
     assert result is False
 
@@ -133,16 +199,18 @@ def test_is_directory_command(
     cmd = provider.get_command("is_directory").create_command(str(test_subdir))
     assert isinstance(cmd, str)
     assert str(test_subdir) in cmd
+    argv = provider.get_command("is_directory").create_argv(str(test_subdir))
+    assert str(test_subdir) in argv[-1]
 
-    output, exit_code = run_command(cmd)
+    output, exit_code = run_argv(argv)
     result = provider.get_command("is_directory").parse_command(output, exit_code)
     assert result is True
 
     # Test file (should be False)
-    cmd = provider.get_command("is_directory").create_command(str(test_file))
-    assert str(test_file) in cmd
+    argv = provider.get_command("is_directory").create_argv(str(test_file))
+    assert str(test_file) in argv[-1]
 
-    output, exit_code = run_command(cmd)
+    output, exit_code = run_argv(argv)
     result = provider.get_command("is_directory").parse_command(output, exit_code)
     assert result is False
 
@@ -183,9 +251,11 @@ def test_file_info_command(provider: OSCommandProvider, test_file: Path):
     cmd = provider.get_command("file_info").create_command(str(test_file))
     assert isinstance(cmd, str)
     assert str(test_file) in cmd
+    argv = provider.get_command("file_info").create_argv(str(test_file))
+    assert str(test_file) in argv[-1]
 
     # Execute command
-    output, exit_code = run_command(cmd)
+    output, exit_code = run_argv(argv)
 
     if exit_code == 0:  # Only test if command succeeded
         # Parse result
@@ -231,8 +301,8 @@ def test_dot_directories_filtering(provider: OSCommandProvider, temp_dir: Path):
     """Test if dot directories are filtered from listings."""
     (temp_dir / "file.txt").write_text("content")
 
-    cmd = provider.get_command("list_directory").create_command(str(temp_dir))
-    output, _exit_code = run_command(cmd)
+    argv = provider.get_command("list_directory").create_argv(str(temp_dir))
+    output, _exit_code = run_argv(argv)
     entries = provider.get_command("list_directory").parse_command(output, str(temp_dir))
     names = [e.name for e in entries]
 
@@ -240,3 +310,17 @@ def test_dot_directories_filtering(provider: OSCommandProvider, temp_dir: Path):
     print(f"Dot entries: {[n for n in names if n in ('.', '..')]}")
     assert "." not in names
     assert ".." not in names
+
+
+def test_parse_cached(provider: OSCommandProvider, temp_dir: Path, test_file: Path):
+    """Test cached parsing returns equal results without sharing the list."""
+    argv = provider.get_command("list_directory").create_argv(str(temp_dir))
+    output, _exit_code = run_argv(argv)
+
+    first = provider.parse_cached("list_directory", output, str(temp_dir))
+    second = provider.parse_cached("list_directory", output, str(temp_dir))
+    assert first == provider.get_command("list_directory").parse_command(output, str(temp_dir))
+    assert first == second
+    assert first is not second
+    assert test_file.name in [entry.name for entry in first]
+    provider.clear_parse_cache()
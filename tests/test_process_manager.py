@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
 import tempfile
+from unittest.mock import Mock
 
-import anyio
 import pytest
 
-from anyenv.process_manager import ProcessManager, ProcessOutput
+from anyenv.process_manager import ProcessManager, ProcessOutput, RunningProcess
 
 
 @pytest.fixture
-def process_manager():
-    """Create a ProcessManager instance for testing."""
-    return ProcessManager()
+async def process_manager():
+    """Create a ProcessManager instance, cleaning up its processes afterwards."""
+    manager = ProcessManager()
+    yield manager
+    await manager.cleanup()
 
 
 async def test_process_manager_initialization(process_manager: ProcessManager):
@@ -26,23 +29,21 @@ async def test_process_manager_initialization(process_manager: ProcessManager):
 
 async def test_start_process_success(process_manager: ProcessManager):
     """Test successfully starting a process."""
-    process_id = await process_manager.start_process("echo", ["hello"])
+    process_id = await process_manager.start_process("true", ["hello"])
 
     assert process_id.startswith("proc_")
     assert process_id in process_manager.processes
     assert process_id in process_manager.output_tasks
 
     running_proc = process_manager.processes[process_id]
-    assert running_proc.command == "echo"
+    assert running_proc.command == "true"
     assert running_proc.args == ["hello"]
 
-    await process_manager.cleanup()
-
 
 async def test_start_process_with_options(process_manager: ProcessManager):
     """Test starting a process with environment and working directory."""
     process_id = await process_manager.start_process(
-        "echo",
+        "true",
         args=["hello"],
         cwd=tempfile.gettempdir(),
         env={"TEST_VAR": "test_value"},
@@ -51,16 +52,14 @@ async def test_start_process_with_options(process_manager: ProcessManager):
 
     assert process_id in process_manager.processes
     running_proc = process_manager.processes[process_id]
-    assert running_proc.command == "echo"
-
-    await process_manager.cleanup()
+    assert running_proc.command == "true"
 
 
 async def test_start_process_failure(process_manager: ProcessManager):
     """Test handling process creation failure."""
     with pytest.raises(OSError, match="Failed to start process"):
         await process_manager.start_process(
-            "nonexistent_command_that_does_not_exist_12345", args=["arg"]
+            "/nonexistent_command_that_does_not_exist_12345", args=["arg"]
         )
 
 
@@ -68,16 +67,12 @@ async def test_get_output_success(process_manager: ProcessManager):
     """Test getting process output."""
     process_id = await process_manager.start_process("echo", ["hello"])
 
-    # Wait for process to complete and output to be collected
     await process_manager.wait_for_exit(process_id)
-    await anyio.sleep(0.05)  # Small delay for output collection
 
     output = await process_manager.get_output(process_id)
     assert isinstance(output, ProcessOutput)
     assert "hello" in output.stdout
 
-    await process_manager.cleanup()
-
 
 async def test_get_output_nonexistent_process(process_manager: ProcessManager):
     """Test getting output for non-existent process."""
@@ -95,8 +90,6 @@ async def test_wait_for_exit(process_manager: ProcessManager):
     exit_code = await process_manager.wait_for_exit(process_id)
     assert exit_code == 42  # noqa: PLR2004
 
-    await process_manager.cleanup()
-
 
 async def test_kill_process(process_manager: ProcessManager):
     """Test killing a running process."""
@@ -108,12 +101,8 @@ async def test_kill_process(process_manager: ProcessManager):
 
     await process_manager.kill_process(process_id)
 
-    # Wait a moment for termination
-    await anyio.sleep(0.1)
     assert not await running_proc.is_running()
 
-    await process_manager.cleanup()
-
 
 async def test_kill_nonexistent_process(process_manager: ProcessManager):
     """Test killing non-existent process."""
@@ -123,7 +112,7 @@ async def test_kill_nonexistent_process(process_manager: ProcessManager):
 
 async def test_release_process(process_manager: ProcessManager):
     """Test releasing process resources."""
-    process_id = await process_manager.start_process("echo", ["hello"])
+    process_id = await process_manager.start_process("true", ["hello"])
 
     # Verify process is tracked
     assert process_id in process_manager.processes
@@ -140,37 +129,37 @@ async def test_list_processes(process_manager: ProcessManager):
     """Test listing active processes."""
     assert await process_manager.list_processes() == []
 
-    process_id1 = await process_manager.start_process("echo", ["hello"])
-    process_id2 = await process_manager.start_process("echo", ["world"])
+    process_id1, process_id2 = await asyncio.gather(
+        process_manager.start_process("true", ["hello"]),
+        process_manager.start_process("true", ["world"]),
+    )
 
     processes = await process_manager.list_processes()
     assert len(processes) == 2  # noqa: PLR2004
     assert process_id1 in processes
     assert process_id2 in processes
 
-    await process_manager.cleanup()
-
 
 async def test_get_process_info(process_manager: ProcessManager):
     """Test getting process information."""
-    process_id = await process_manager.start_process("echo", ["arg1"])
+    process_id = await process_manager.start_process("true", ["arg1"])
 
     info = await process_manager.get_process_info(process_id)
 
     assert info["process_id"] == process_id
-    assert info["command"] == "echo"
+    assert info["command"] == "true"
     assert info["args"] == ["arg1"]
     assert "created_at" in info
     assert "is_running" in info
 
-    await process_manager.cleanup()
-
 
 async def test_cleanup(process_manager: ProcessManager):
     """Test cleaning up all processes."""
     # Start some long-running processes
-    await process_manager.start_process("sleep", ["10"])
-    await process_manager.start_process("sleep", ["10"])
+    await asyncio.gather(
+        process_manager.start_process("sleep", ["10"]),
+        process_manager.start_process("sleep", ["10"]),
+    )
 
     # Verify processes exist
     assert len(process_manager.processes) == 2  # noqa: PLR2004
@@ -195,13 +184,11 @@ async def test_output_truncation(process_manager: ProcessManager):
     )
 
     await process_manager.wait_for_exit(process_id)
-    await anyio.sleep(0.05)  # Small delay for output collection
 
     output = await process_manager.get_output(process_id)
     assert output.truncated
-    assert len(output.stdout.encode()) <= output_limit
-
-    await process_manager.cleanup()
+    assert output.stdout_bytes == len(output.stdout.encode())
+    assert output.stdout_bytes <= output_limit
 
 
 async def test_shell_command(process_manager: ProcessManager):
@@ -209,32 +196,27 @@ async def test_shell_command(process_manager: ProcessManager):
     process_id = await process_manager.start_process("echo hello && echo world")
 
     await process_manager.wait_for_exit(process_id)
-    await anyio.sleep(0.05)
 
     output = await process_manager.get_output(process_id)
     assert "hello" in output.stdout
     assert "world" in output.stdout
 
-    await process_manager.cleanup()
-
 
 class TestRunningProcess:
     """Tests for RunningProcess class."""
 
-    async def test_add_output(self, process_manager: ProcessManager):
+    def test_add_output(self):
         """Test adding output to process."""
-        process_id = await process_manager.start_process("echo", ["hello"])
-        proc = process_manager.processes[process_id]
+        proc = RunningProcess("proc_test", "true", [], process=Mock(returncode=0))
 
         # Manually add some output
         proc.add_output(stdout="manual", stderr="error")
 
         output = proc.get_output()
         assert "manual" in output.stdout
+        assert output.stdout_bytes == len("manual")
         assert "error" in output.stderr
 
-        await process_manager.cleanup()
-
     async def test_is_running(self, process_manager: ProcessManager):
         """Test checking if process is running."""
         # Start a long-running process
@@ -244,12 +226,9 @@ class TestRunningProcess:
         assert await proc.is_running()
 
         await process_manager.kill_process(process_id)
-        await anyio.sleep(0.1)
 
         assert not await proc.is_running()
 
-        await process_manager.cleanup()
-
 
 class TestProcessOutput:
     """Tests for ProcessOutput class."""
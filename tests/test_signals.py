@@ -0,0 +1,246 @@
+"""Tests for type-safe async signals."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import copy
+import gc
+import pickle
+
+import pytest
+
+from anyenv.signals import Signal
+
+
+class Emitter:
+    """Object exposing a single signal."""
+
+    changed = Signal[int]()
+
+
+async def test_connect_emit_disconnect():
+    """Test that connected handlers receive emissions until disconnected."""
+    emitter = Emitter()
+    received: list[int] = []
+
+    async def on_changed(value: int) -> None:
+        received.append(value)
+
+    emitter.changed.connect(on_changed)
+    await emitter.changed.emit(1)
+    emitter.changed.disconnect(on_changed)
+    await emitter.changed.emit(2)
+    assert received == [1]
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        emitter.changed.disconnect(on_changed)
+
+
+async def test_emit_uses_snapshot_of_handlers():
+    """Test that handlers (dis)connected during emit only apply to the next emit."""
+    emitter = Emitter()
+    calls: list[str] = []
+
+    def late(value: int) -> None:
+        calls.append(f"late {value}")
+
+    def first(value: int) -> None:
+        calls.append(f"first {value}")
+        emitter.changed.disconnect(first)
+        emitter.changed.connect(late)
+
+    emitter.changed.connect(first)
+    await emitter.changed.emit(1)
+    await emitter.changed.emit(2)
+    assert calls == ["first 1", "late 2"]
+
+
+async def test_signal_state_is_created_on_first_connect():
+    """Test that unconnected signals keep no per-instance state."""
+    emitter = Emitter()
+    received: list[int] = []
+    first_ref = emitter.changed
+    second_ref = emitter.changed
+    await first_ref.emit(0)
+    assert emitter.changed is not emitter.changed  # nothing stored yet
+
+    first_ref.connect(received.append)
+    await second_ref.emit(1)
+    await emitter.changed.emit(2)
+    assert received == [1, 2]
+    assert emitter.changed is emitter.changed
+
+
+async def test_emit_error_propagation():
+    """Test that handler errors raise an ExceptionGroup regardless of handler count."""
+    emitter = Emitter()
+
+    async def failing(value: int) -> None:
+        raise RuntimeError(value)
+
+    async def passing(value: int) -> None:
+        pass
+
+    emitter.changed.connect(failing)
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await emitter.changed.emit(1)
+    assert exc_info.group_contains(RuntimeError)
+
+    emitter.changed.connect(passing)
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await emitter.changed.emit(2)
+    assert exc_info.group_contains(RuntimeError)
+
+
+async def test_emit_batched_coalesces_emissions():
+    """Test that batched emissions are delivered together on the next loop iteration."""
+    emitter = Emitter()
+    received: list[int] = []
+
+    async def on_changed(value: int) -> None:
+        received.append(value)
+
+    emitter.changed.connect(on_changed)
+    for i in range(3):
+        emitter.changed.emit_batched(i)
+    assert received == []
+
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert received == [0, 1, 2]
+
+
+async def test_emit_batched_reports_errors_per_event():
+    """Test that a failing batched handler does not drop later events."""
+    emitter = Emitter()
+    received: list[int] = []
+    errors: list[BaseException] = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda _loop, context: errors.append(context["exception"]))
+
+    def on_changed(value: int) -> None:
+        if value == 0:
+            raise RuntimeError(value)
+        received.append(value)
+
+    async def failing(value: int) -> None:
+        raise ValueError(value)
+
+    emitter.changed.connect(on_changed)
+    emitter.changed.connect(failing)
+    for i in range(3):
+        emitter.changed.emit_batched(i)
+    await asyncio.sleep(0.01)
+
+    assert received == [1, 2]
+    assert [type(exc) for exc in errors] == [RuntimeError, ValueError, ValueError, ValueError]
+    loop.set_exception_handler(None)
+
+
+async def test_signal_on_slotted_instance():
+    """Test that instances without __dict__ are supported via weakref tracking."""
+
+    class Slotted:
+        __slots__ = ("__weakref__",)
+        changed = Signal[int]()
+
+    obj = Slotted()
+    received: list[int] = []
+    obj.changed.connect(received.append)
+    await obj.changed.emit(1)
+    assert received == [1]
+    assert obj.changed is obj.changed
+
+    del obj
+    gc.collect()
+    assert not Slotted.changed._bound_signals  # noqa: SLF001
+
+
+async def test_bound_signal_is_not_instance_state():
+    """Test that copies and pickles of an instance do not carry its handlers."""
+    emitter = Emitter()
+    received: list[int] = []
+    emitter.changed.connect(lambda value: received.append(value))
+    assert "changed" not in vars(emitter)
+
+    duplicate = copy.copy(emitter)
+    await duplicate.changed.emit(1)
+    assert received == []
+
+    restored = pickle.loads(pickle.dumps(emitter))
+    assert not restored.changed.has_subscribers
+
+
+async def test_emit_nowait_only_creates_tasks_for_suspending_handlers():
+    """Test that inline-completing handlers run without a task and others resume."""
+    emitter = Emitter()
+    calls: list[str] = []
+
+    async def immediate(value: int) -> None:
+        calls.append(f"immediate {value}")
+
+    async def suspending(value: int) -> None:
+        calls.append(f"before {value}")
+        await asyncio.sleep(0.01)
+        calls.append(f"after {value}")
+
+    emitter.changed.connect(immediate)
+    emitter.changed.connect(suspending)
+    tasks = emitter.changed.emit_nowait(1)
+    assert calls == ["immediate 1", "before 1"]
+    assert len(tasks) == 1
+
+    await asyncio.gather(*tasks)
+    assert calls == ["immediate 1", "before 1", "after 1"]
+
+
+async def test_emit_nowait_runs_handlers_in_own_task():
+    """Test that handler timeouts and context changes do not leak into the caller."""
+    emitter = Emitter()
+    var: contextvars.ContextVar[int] = contextvars.ContextVar("var", default=0)
+    timed_out: list[int] = []
+
+    async def handler(value: int) -> None:
+        var.set(value)
+        try:
+            async with asyncio.timeout(0.01):
+                await asyncio.sleep(1)
+        except TimeoutError:
+            timed_out.append(value)
+
+    emitter.changed.connect(handler)
+    tasks = emitter.changed.emit_nowait(1)
+    assert var.get() == 0
+
+    await asyncio.gather(*tasks)
+    assert timed_out == [1]
+
+
+async def test_emit_if_connected():
+    """Test that emit_if_connected delivers only when handlers are connected."""
+    emitter = Emitter()
+    received: list[int] = []
+    await emitter.changed.emit_if_connected(1)
+
+    emitter.changed.connect(received.append)
+    await emitter.changed.emit_if_connected(2)
+    assert received == [2]
+
+
+async def test_has_subscribers():
+    """Test that has_subscribers and is_connected reflect connected handlers."""
+    emitter = Emitter()
+    assert not emitter.changed.has_subscribers
+
+    def on_changed(value: int) -> None:
+        pass
+
+    assert not Emitter.changed.is_connected(emitter)
+
+    emitter.changed.connect(on_changed)
+    assert emitter.changed.has_subscribers
+    assert Emitter.changed.is_connected(emitter)
+    emitter.changed.disconnect(on_changed)
+    assert not emitter.changed.has_subscribers
+    assert not Emitter.changed.is_connected(emitter)
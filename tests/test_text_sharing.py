@@ -0,0 +1,169 @@
+"""Tests for the OpenCode text sharer."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import gc
+from typing import TYPE_CHECKING
+
+import pytest
+
+
+httpx = pytest.importorskip("httpx")
+
+from anyenv.json_tools import load_json  # noqa: E402
+from anyenv.text_sharing.base import ShareResult  # noqa: E402
+from anyenv.text_sharing.opencode import (  # noqa: E402
+    _SHARED_CLIENTS,
+    OpenCodeSharer,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+API_URL = "https://api.example.test"
+
+
+@pytest.fixture
+def requests(monkeypatch: pytest.MonkeyPatch) -> list[httpx.Request]:
+    """Route all OpenCode clients through a mock transport and record requests."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.path == "/share_create":
+            return httpx.Response(200, json={"secret": "s3cret", "url": "https://x/s/1"})
+        return httpx.Response(200, json={})
+
+    _use_handler(monkeypatch, handler)
+    return seen
+
+
+def _use_handler(
+    monkeypatch: pytest.MonkeyPatch,
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> None:
+    transport = httpx.MockTransport(handler)
+    client_cls = functools.partial(httpx.AsyncClient, transport=transport)
+    monkeypatch.setattr(httpx, "AsyncClient", client_cls)
+
+
+async def test_share(requests: list[httpx.Request]):
+    """Test that share creates a session and syncs info, message and part."""
+    async with OpenCodeSharer(api_url=API_URL) as sharer:
+        result = await sharer.share("hello", title="greeting")
+
+    assert result.url == "https://x/s/1"
+    assert result.delete_url == f"{API_URL}/share_delete#s3cret"
+    assert result.id is not None
+    assert result.raw_url == f"{API_URL}/share_data?id={result.id[-8:]}"
+    paths = [r.url.path for r in requests]
+    assert paths == ["/share_create"] + ["/share_sync"] * 3
+    assert load_json(requests[0].content) == {"sessionID": result.id}
+    part = load_json(requests[3].content)
+    assert part["content"]["text"] == "hello"
+
+
+@pytest.mark.parametrize(
+    ("status", "message"),
+    [
+        (404, "endpoint not found"),
+        (429, "Rate limited"),
+        (500, "HTTP 500"),
+    ],
+)
+async def test_share_api_errors(monkeypatch: pytest.MonkeyPatch, status: int, message: str):
+    """Test that error responses are raised as RuntimeError."""
+    _use_handler(monkeypatch, lambda request: httpx.Response(status, text="nope"))
+    async with OpenCodeSharer(api_url=API_URL) as sharer:
+        with pytest.raises(RuntimeError, match=message):
+            await sharer.share("hello")
+
+
+async def test_share_invalid_json(monkeypatch: pytest.MonkeyPatch):
+    """Test that an unparsable response is raised as RuntimeError."""
+    _use_handler(monkeypatch, lambda request: httpx.Response(200, text="{not json"))
+    async with OpenCodeSharer(api_url=API_URL) as sharer:
+        with pytest.raises(RuntimeError, match="Invalid response"):
+            await sharer.share("hello")
+
+
+async def test_share_connect_error(monkeypatch: pytest.MonkeyPatch):
+    """Test that transport errors are raised as RuntimeError."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("unreachable", request=request)
+
+    _use_handler(monkeypatch, handler)
+    async with OpenCodeSharer(api_url=API_URL) as sharer:
+        with pytest.raises(RuntimeError, match="Failed to connect"):
+            await sharer.share("hello")
+
+
+async def test_delete_share(monkeypatch: pytest.MonkeyPatch):
+    """Test deleting shares, including failures and results without a secret."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        status = 200 if load_json(request.content)["sessionID"] == "ok" else 500
+        return httpx.Response(status, json={})
+
+    _use_handler(monkeypatch, handler)
+    delete_url = f"{API_URL}/share_delete#s3cret"
+    async with OpenCodeSharer(api_url=API_URL) as sharer:
+        assert await sharer.delete_share(ShareResult("u", delete_url=delete_url, id="ok"))
+        assert not await sharer.delete_share(ShareResult("u", delete_url=delete_url, id="bad"))
+        assert not await sharer.delete_share(ShareResult("u", delete_url="u", id="ok"))
+
+    assert len(seen) == 2  # noqa: PLR2004
+    assert load_json(seen[0].content) == {"sessionID": "ok", "secret": "s3cret"}
+
+
+async def test_shared_client_refcount(requests: list[httpx.Request]):
+    """Test that sharers share one client, closed only with its last sharer."""
+    first = OpenCodeSharer(api_url=API_URL)
+    second = OpenCodeSharer(api_url=API_URL)
+    await first.share("a")
+    await second.share("b")
+    client = await first._get_client()  # noqa: SLF001
+    assert await second._get_client() is client  # noqa: SLF001
+
+    await first.close()
+    assert not client.is_closed
+    await second.close()
+    assert client.is_closed
+    assert not _SHARED_CLIENTS.get(asyncio.get_running_loop())
+
+
+async def test_shared_client_released_on_collect(requests: list[httpx.Request]):
+    """Test that a sharer collected without close drops its client reference."""
+    sharer = OpenCodeSharer(api_url=API_URL)
+    await sharer.share("a")
+    loop = asyncio.get_running_loop()
+    assert _SHARED_CLIENTS[loop]
+
+    del sharer
+    gc.collect()
+    assert not _SHARED_CLIENTS[loop]
+
+
+def test_sharer_reused_across_loops(requests: list[httpx.Request]):
+    """Test that a sharer gets a fresh client on each event loop."""
+    sharer = OpenCodeSharer(api_url=API_URL)
+    clients: list[httpx.AsyncClient] = []
+
+    async def share() -> None:
+        await sharer.share("hello")
+        clients.append(await sharer._get_client())  # noqa: SLF001
+
+    asyncio.run(share())
+    asyncio.run(share())
+    asyncio.run(sharer.close())
+
+    assert clients[0] is not clients[1]
+    assert not clients[0].is_closed  # its loop was gone before it could be closed
+    assert len(requests) == 8  # noqa: PLR2004
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import contextvars
+import threading
+import time
 
 import pytest
 
@@ -30,5 +32,86 @@ def test_threadgroup():
     assert tg.results == ["main thread value"]
 
 
+def test_threadgroup_results_keep_submission_order():
+    """Test that results are collected in spawn order, not completion order."""
+
+    def work(i: int) -> int:
+        time.sleep((5 - i) * 0.01)  # later tasks finish first
+        return i
+
+    with ThreadGroup[int]() as tg:
+        for i in range(5):
+            tg.spawn(work, i)
+    assert tg.results == [0, 1, 2, 3, 4]
+
+
+def test_threadgroup_collects_exceptions():
+    """Test that task errors are collected alongside results when not raised."""
+
+    def fail() -> int:
+        raise ValueError
+
+    with ThreadGroup[int](raise_exceptions=False) as tg:
+        tg.spawn(fail)
+        tg.spawn(int, "1")
+    assert tg.results == [1]
+    assert [type(e) for e in tg.exceptions] == [ValueError]
+
+
+def test_threadgroup_cancels_pending_tasks_on_error():
+    """Test that queued tasks are cancelled once a task error is raised."""
+    release = threading.Event()
+
+    def fail() -> int:
+        msg = "boom"
+        raise ValueError(msg)
+
+    tg = ThreadGroup[object](max_workers=1)
+    with pytest.raises(ValueError, match="boom"), tg:  # noqa: PT012
+        tg.spawn(fail)
+        tg.spawn(release.wait)  # keeps the only worker busy
+        queued = tg.spawn(int)
+    release.set()
+    assert queued.cancelled()
+    tg.shutdown()
+
+
+def test_threadgroup_shared_executor():
+    """Test that shared groups use one executor that survives shutdown."""
+    first = ThreadGroup[int](shared=True)
+    second = ThreadGroup[int](shared=True)
+    assert first.executor is second.executor
+    assert ThreadGroup[int]().executor is not first.executor
+    assert ThreadGroup[int](max_workers=2, shared=True).executor is not first.executor
+
+    first.shutdown()
+    with second:
+        second.spawn(int, "2")
+    assert second.results == [2]
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_threadgroup_nested_groups(shared: bool):
+    """Test that groups opened inside tasks do not deadlock on a busy pool."""
+
+    def outer(value: int) -> int:
+        with ThreadGroup[int](shared=shared) as inner:
+            inner.spawn(abs, -value)
+        return inner.results[0]
+
+    with ThreadGroup[int](shared=shared) as tg:
+        tg.spawn_many(outer, [(i,) for i in range(64)])
+    assert tg.results == list(range(64))
+
+
+def test_threadgroup_spawn_many():
+    """Test that spawn_many submits one task per argument tuple."""
+    with ThreadGroup[int]() as tg:
+        tg.spawn(pow, 2, 1)
+        futures = tg.spawn_many(pow, [(2, 2), (2, 3)])
+    assert [f.result() for f in futures] == [4, 8]
+    assert tg.results == [2, 4, 8]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,15 @@
+"""Tests for TOML providers."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def test_toml_rs_dump_empty_table():
+    """Test that the empty-table shortcut matches what toml_rs itself produces."""
+    toml_rs = pytest.importorskip("toml_rs")
+    from anyenv.toml_tools.toml_rs_provider import TomlRsProvider
+
+    assert toml_rs.dumps({}) == ""
+    assert TomlRsProvider.dump_toml({}) == ""
+    assert TomlRsProvider.load_toml(TomlRsProvider.dump_toml({"a": 1})) == {"a": 1}